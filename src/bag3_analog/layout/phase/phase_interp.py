@@ -13,11 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, Union, List, Optional, Type
+from typing import Any, Dict, Union, List, Optional, Type, Tuple
 
 from bag.util.immutable import Param
 from bag.design.module import Module
 from bag.layout.routing.base import TrackID, WireArray
+from bag.layout.core import PyLayInstance
 from bag.layout.template import TemplateDB
 from pybag.enum import RoundMode
 
@@ -93,8 +94,9 @@ class PhaseInterpUnit(MOSBase):
         # routing
         out = core.get_pin('out')
         tr_off = out.track_id.base_index - loc_list[2]
-        sig_l = out.middle - vm_l // 2
-        sup_l = out.middle - vm_l_sup // 2
+        out_mid = out.middle
+        sig_l = out_mid - vm_l // 2
+        sup_l = out_mid - vm_l_sup // 2
         sup_u = sup_l + vm_l_sup
         enl = self.add_wires(vm_layer, loc_list[1] + tr_off, sig_l, sig_l + vm_l, width=vm_w)
         enr = self.add_wires(vm_layer, loc_list[3] + tr_off, enl.lower, enl.upper, width=vm_w)
@@ -238,41 +240,17 @@ class PhaseInterpolator(MOSBase):
         pin_dict = {name: [] for name in pin_list}
         cur_col = 1 if draw_sub else 0
         unit_ncol = unit_master.num_cols
+        if abut_tristates:
+            draw_unit = self._draw_unit_abut
+            # vm_layer supply wires are drawn here instead of exported by the unit
+            unit_pins = [name for name in pin_list if name != 'VDD_vm' and name != 'VSS_vm']
+        else:
+            draw_unit = self._draw_unit
+            unit_pins = pin_list
         for idx in range(nbits):
             inst = self.add_tile(unit_master, tile_idx, cur_col)
-            if abut_tristates:
-                en = inst.get_pin('en')
-                enb = inst.get_pin('enb')
-                en_tr_idx = self.grid.coord_to_track(vm_layer, en.middle, RoundMode.LESS)
-                enb_tr_idx = self.grid.coord_to_track(vm_layer, en.middle, RoundMode.GREATER)
-                sup_tr_idx = self.tr_manager.get_next_track(vm_layer, en_tr_idx, 'sig', 'sup',
-                                                            up=False)
-                if flip_en:
-                    en, enb = self.connect_differential_tracks(en, enb, vm_layer, en_tr_idx,
-                                                               enb_tr_idx)
-                else:
-                    en, enb = self.connect_differential_tracks(en, enb, vm_layer, enb_tr_idx,
-                                                               en_tr_idx)
-                sup_w = self.add_wires(vm_layer, sup_tr_idx, en.middle - vm_sup_l // 2,
-                                       en.middle + vm_sup_l // 2, width=vm_sup_w)
-                if idx & 1:
-                    pin_dict['VDD_vm'].append(sup_w)
-                else:
-                    pin_dict['VSS_vm'].append(sup_w)
-                for pin in pin_list:
-                    if pin not in ['VDD_vm', 'VSS_vm']:
-                        pin_dict[pin].append(inst.get_pin(pin))
-            else:
-                for name in pin_list:
-                    pin_dict[name].append(inst.get_pin(name))
-                enl = inst.get_pin('enl')
-                enr = inst.get_pin('enr')
-                en = inst.get_pin('en')
-                enb = inst.get_pin('enb')
-                if flip_en:
-                    en, enb = self.connect_differential_wires(en, enb, enr, enl)
-                else:
-                    en, enb = self.connect_differential_wires(en, enb, enl, enr)
+            en, enb = draw_unit(inst, idx, flip_en, unit_pins, pin_dict, vm_layer, vm_sup_w,
+                                vm_sup_l)
 
             # NOTE: LSB closest to the output to help with nonlinearity
             bit_idx = nbits - 1 - idx
@@ -312,3 +290,40 @@ class PhaseInterpolator(MOSBase):
             vdd_vm_list.append(vdd_vm)
         return {'mid': pin_dict['out'], 'out': buf_out, 'VSS': vss_vm_list, 'VDD': vdd_vm_list,
                 'VSS_hm': vss, 'VDD_hm': [vdd]}
+
+    def _draw_unit(self, inst: PyLayInstance, idx: int, flip_en: bool, pin_list: List[str],
+                   pin_dict: Dict[str, List[WireArray]], vm_layer: int, vm_sup_w: int,
+                   vm_sup_l: int) -> Tuple[WireArray, WireArray]:
+        for name in pin_list:
+            pin_dict[name].append(inst.get_pin(name))
+        enl = inst.get_pin('enl')
+        enr = inst.get_pin('enr')
+        en = inst.get_pin('en')
+        enb = inst.get_pin('enb')
+        if flip_en:
+            return self.connect_differential_wires(en, enb, enr, enl)
+        return self.connect_differential_wires(en, enb, enl, enr)
+
+    def _draw_unit_abut(self, inst: PyLayInstance, idx: int, flip_en: bool, pin_list: List[str],
+                        pin_dict: Dict[str, List[WireArray]], vm_layer: int, vm_sup_w: int,
+                        vm_sup_l: int) -> Tuple[WireArray, WireArray]:
+        en = inst.get_pin('en')
+        enb = inst.get_pin('enb')
+        en_mid = en.middle
+        en_tr_idx = self.grid.coord_to_track(vm_layer, en_mid, RoundMode.LESS)
+        enb_tr_idx = self.grid.coord_to_track(vm_layer, en_mid, RoundMode.GREATER)
+        sup_tr_idx = self.tr_manager.get_next_track(vm_layer, en_tr_idx, 'sig', 'sup', up=False)
+        if flip_en:
+            en, enb = self.connect_differential_tracks(en, enb, vm_layer, en_tr_idx, enb_tr_idx)
+        else:
+            en, enb = self.connect_differential_tracks(en, enb, vm_layer, enb_tr_idx, en_tr_idx)
+        # NOTE: en is now the vm_layer wire, so its middle is a y coordinate
+        sup_l = en.middle - vm_sup_l // 2
+        sup_w = self.add_wires(vm_layer, sup_tr_idx, sup_l, sup_l + vm_sup_l, width=vm_sup_w)
+        if idx & 1:
+            pin_dict['VDD_vm'].append(sup_w)
+        else:
+            pin_dict['VSS_vm'].append(sup_w)
+        for name in pin_list:
+            pin_dict[name].append(inst.get_pin(name))
+        return en, enb
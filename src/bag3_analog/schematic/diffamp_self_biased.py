@@ -34,6 +34,10 @@ class bag3_analog__diffamp_self_biased(Module):
                                                 str(Path('netlist_info',
                                                          'diffamp_self_biased.yaml')))
 
+    # (instance name, device key) pairs for the core transistors
+    _MOS_NAME_INFO = (('XGMn_left', 'gm_n'), ('XGMn_right', 'gm_n'), ('XTailn', 'tail_n'),
+                      ('XGMp_left', 'gm_p'), ('XGMp_right', 'gm_p'), ('XTailp', 'tail_p'))
+
     def __init__(self, database: ModuleDB, params: Param, **kwargs: Any) -> None:
         Module.__init__(self, self.yaml_file, database, params, **kwargs)
 
@@ -78,10 +82,7 @@ class bag3_analog__diffamp_self_biased(Module):
         array_instance()
         """
 
-        for _name, _str in zip(['XGMn_left', 'XGMn_right', 'XTailn'], ['gm_n', 'gm_n', 'tail_n']):
-            self.design_transistor(_name, w_dict[_str], lch, seg_dict[_str], th_dict[_str], m='')
-
-        for _name, _str in zip(['XGMp_left', 'XGMp_right', 'XTailp'], ['gm_p', 'gm_p', 'tail_p']):
+        for _name, _str in self._MOS_NAME_INFO:
             self.design_transistor(_name, w_dict[_str], lch, seg_dict[_str], th_dict[_str], m='')
 
         self.design_dummy_transistors(dum_info, 'XDUM', 'VDD', 'VSS')
@@ -62,6 +62,7 @@ class bag3_analog__phase_interp(Module):
         if nbits < 2:
             raise ValueError('nbits must be >= 2')
 
+        insts = self.instances
         suffix = f'<{nbits - 1}:0>'
         for name in ['a', 'b']:
             basename = f'XINV{name.upper()}'
@@ -69,10 +70,10 @@ class bag3_analog__phase_interp(Module):
                           ('out', name + '_outb' + suffix)]
             new_name = basename + suffix
             self.rename_instance(basename, new_name, conn_list=inst_conns)
-            self.instances[new_name].design(**tri_params)
+            insts[new_name].design(**tri_params)
 
-        self.instances['XBUF'].design(**inv_params)
-        self.instances['XSUM'].design(nin=2 * nbits)
+        insts['XBUF'].design(**inv_params)
+        insts['XSUM'].design(nin=2 * nbits)
         self.reconnect_instance_terminal('XSUM', f'in<{2 * nbits - 1}:0>',
                                          f'a_outb{suffix},b_outb{suffix}')
 